@@ -1,8 +1,8 @@
-import json
 import os
 import random
+import re
 import sys
-import urllib.request
+from functools import lru_cache
 from hashlib import sha256
 from os.path import exists
 
@@ -11,91 +11,99 @@ from dotenv import load_dotenv
 
 from pycardano import *
 
+_SPLIT_64_CHARS = re.compile(r".{1,64}", re.S)
 
-def split_into_64chars(string):
-    return [string[i : i + 64] for i in range(0, len(string), 64)]
-
-
-load_dotenv()
-network = os.getenv("network")
-wallet_mnemonic = os.getenv("wallet_mnemonic")
-blockfrost_api_key = os.getenv("blockfrost_api_key")
-
-
-if network == "testnet":
-    base_url = ApiUrls.preprod.value
-    cardano_network = Network.TESTNET
-else:
-    base_url = ApiUrls.mainnet.value
-    cardano_network = Network.MAINNET
 
+def split_into_64chars(string):
+    return _SPLIT_64_CHARS.findall(string)
 
-new_wallet = crypto.bip32.HDWallet.from_mnemonic(wallet_mnemonic)
-payment_key = new_wallet.derive_from_path(f"m/1852'/1815'/0'/0/0")
-staking_key = new_wallet.derive_from_path(f"m/1852'/1815'/0'/2/0")
-payment_skey = ExtendedSigningKey.from_hdwallet(payment_key)
-staking_skey = ExtendedSigningKey.from_hdwallet(staking_key)
 
+@lru_cache(maxsize=None)
+def _init_context():
+    # Deriving the keys from the mnemonic is expensive, so only do it once per process and not on import.
+    load_dotenv()
+    network = os.getenv("network")
+    wallet_mnemonic = os.getenv("wallet_mnemonic")
+    blockfrost_api_key = os.getenv("blockfrost_api_key")
 
-main_address = Address(
-    payment_part=payment_skey.to_verification_key().hash(),
-    staking_part=staking_skey.to_verification_key().hash(),
-    network=cardano_network,
-)
+    if network == "testnet":
+        base_url = ApiUrls.preprod.value
+    else:
+        base_url = ApiUrls.mainnet.value
 
+    new_wallet = crypto.bip32.HDWallet.from_mnemonic(wallet_mnemonic)
+    payment_key = new_wallet.derive_from_path(f"m/1852'/1815'/0'/0/0")
+    payment_skey = ExtendedSigningKey.from_hdwallet(payment_key)
 
-prefix = "a401010327200621"
-jsonkey = json.loads(payment_skey.to_verification_key().to_non_extended().to_json())
+    prefix = "a401010327200621"
+    pubkey_cbor_hex = payment_skey.to_verification_key().to_non_extended().to_cbor_hex()
+    public_key = f"{prefix}{pubkey_cbor_hex}"
 
+    api = BlockFrostApi(project_id=blockfrost_api_key, base_url=base_url)
 
-api = BlockFrostApi(project_id=blockfrost_api_key, base_url=base_url)
-cardano = BlockFrostChainContext(project_id=blockfrost_api_key, base_url=base_url)
+    return api, public_key
 
-# get commandline arguments
 
-transaction_id = sys.argv[1]
-document_hash = sys.argv[2]
+def main():
+    api, public_key = _init_context()
 
+    # get commandline arguments
 
-onchain_metadata = api.transaction_metadata(transaction_id)
+    transaction_id = sys.argv[1]
+    document_hash = sys.argv[2]
 
-if onchain_metadata is None:
-    print("No metadata onchain.")
-    sys.exit(1)
+    onchain_metadata = api.transaction_metadata(transaction_id)
 
+    if onchain_metadata is None:
+        print("No metadata onchain.")
+        sys.exit(1)
 
-if "1787" in onchain_metadata[0].label:
-    print("This transaction has a 1787 metadata label onchain.")
+    if "1787" in onchain_metadata[0].label:
+        print("This transaction has a 1787 metadata label onchain.")
 
-    result = onchain_metadata[0].json_metadata
+        result = onchain_metadata[0].json_metadata
 
-    if document_hash in str(result):
-        print("Document hash found onchain.")
+        # Look the document up by key instead of searching the stringified metadata.
+        if isinstance(result, dict):
+            entry = result.get(document_hash)
+        else:
+            entry = getattr(result, document_hash, None)
 
-        if getattr(result, document_hash).signature:
-            print("Signature found onchain.")
-            signature = getattr(result, document_hash).signature
+        if entry is not None:
+            print("Document hash found onchain.")
 
-            public_key = f"{prefix}{jsonkey['cborHex']}"
+            if isinstance(entry, dict):
+                signature = entry.get("signature")
+            else:
+                signature = getattr(entry, "signature", None)
 
-            signed_message = {
-                "signature": "".join(signature),
-                "key": public_key,
-            }
+            if signature:
+                print("Signature found onchain.")
 
-            result = cip8.verify(signed_message=signed_message, attach_cose_key=True)
+                signed_message = {
+                    "signature": "".join(signature),
+                    "key": public_key,
+                }
 
-            if result["verified"]:
-                print(
-                    "This signature is verified correctly, this document was signed by this wallet/identity."
+                result = cip8.verify(
+                    signed_message=signed_message, attach_cose_key=True
                 )
-                print("Original payload:")
-                print(result["message"])
+
+                if result["verified"]:
+                    print(
+                        "This signature is verified correctly, this document was signed by this wallet/identity."
+                    )
+                    print("Original payload:")
+                    print(result["message"])
+                else:
+                    print("This signature is NOT correct!")
             else:
-                print("This signature is NOT correct!")
+                print("This transaction does not have a signatuer attribute")
         else:
-            print("This transaction does not have a signatuer attribute")
+            print(f"Document hash ({document_hash}) was not found in this transaction.")
     else:
-        print(f"Document hash ({document_hash}) was not found in this transaction.")
-else:
-    print("This transaction DOES NOT have a 1787 metadata label.")
+        print("This transaction DOES NOT have a 1787 metadata label.")
+
+
+if __name__ == "__main__":
+    main()
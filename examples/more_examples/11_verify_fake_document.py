@@ -1,4 +1,3 @@
-import json
 import os
 import random
 import sys
@@ -58,7 +57,9 @@ main_address = Address(
 
 
 prefix = "a401010327200621"
-jsonkey = json.loads(payment_skey.to_verification_key().to_non_extended().to_json())
+public_key = (
+    f"{prefix}{payment_skey.to_verification_key().to_non_extended().to_cbor_hex()}"
+)
 
 
 api = BlockFrostApi(project_id=blockfrost_api_key, base_url=base_url)
@@ -88,8 +89,6 @@ if "1787" in onchain_metadata[0].label:
             print("Signature found onchain.")
             signature = getattr(result, document_hash).signature
 
-            public_key = f"{prefix}{jsonkey['cborHex']}"
-
             signed_message = {
                 "signature": "".join(signature),
                 "key": public_key,
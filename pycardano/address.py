@@ -9,6 +9,7 @@ Specifications and references could be found in:
 from __future__ import annotations
 
 from enum import Enum
+from functools import lru_cache
 from typing import Type, Union
 
 from pycardano.crypto.bech32 import decode, encode
@@ -320,6 +321,9 @@ class Address(CBORSerializable):
     def decode(cls, data: str) -> Address:
         """Decode a bech32 string into an address object.
 
+        Decoded addresses are cached by their bech32 string, so decoding the same string repeatedly returns the
+        same :class:`Address` instance. This is safe because addresses are immutable.
+
         Args:
             data (str): Bech32-encoded string.
 
@@ -334,6 +338,8 @@ class Address(CBORSerializable):
             >>> khash = VerificationKeyHash(bytes.fromhex("cc30497f4ff962f4c1dca54cceefe39f86f1d7179668009f8eb71e59"))
             >>> assert addr == Address(khash)
         """
+        if cls is Address:
+            return _decode_cached(data)
         return cls.from_primitive(data)
 
     def to_primitive(self) -> bytes:
@@ -406,3 +412,8 @@ class Address(CBORSerializable):
 
     def __repr__(self):
         return f"{self.encode()}"
+
+
+@lru_cache(maxsize=1024)
+def _decode_cached(data: str) -> Address:
+    return Address.from_primitive(data)
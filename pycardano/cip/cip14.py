@@ -1,12 +1,11 @@
 from typing import Union
 
-from nacl.encoding import RawEncoder
-from nacl.hash import blake2b
-
 from pycardano.crypto.bech32 import encode
-from pycardano.hash import ScriptHash
+from pycardano.hash import ScriptHash, blake2b_hash
 from pycardano.transaction import AssetName
 
+__all__ = ["encode_asset"]
+
 
 def encode_asset(
     policy_id: Union[ScriptHash, bytes, str], asset_name: Union[AssetName, bytes, str]
@@ -33,10 +32,6 @@ def encode_asset(
     elif isinstance(asset_name, AssetName):
         asset_name = asset_name.payload
 
-    asset_hash = blake2b(
-        policy_id + asset_name,
-        digest_size=20,
-        encoder=RawEncoder,
-    )
+    asset_hash = blake2b_hash(policy_id + asset_name, 20)
 
     return encode("asset", asset_hash)
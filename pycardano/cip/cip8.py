@@ -1,4 +1,5 @@
-from typing import Optional, Union
+from functools import lru_cache
+from typing import Optional, Tuple, Union
 
 from cbor2 import CBORTag, dumps
 from cose.algorithms import EdDSA
@@ -158,14 +159,36 @@ def verify(
         ), "signed_message must be a dict if attach_cose_key is True"
         key = signed_message.get("key")
         signed_message = signed_message.get("signature")  # type: ignore
+        assert isinstance(
+            key, str
+        ), "key must be a hex string if attach_cose_key is True"
 
     else:
         key = ""  # key will be extracted later from the payload headers
 
-    # Add back the "D2" header byte and decode
     assert isinstance(
         signed_message, str
     ), "signed_message must be a hex string at this point"
+
+    verified, message, signing_address = _verify(signed_message, key, attach_cose_key)
+
+    return {
+        "verified": verified,
+        "message": message,
+        "signing_address": signing_address,
+    }
+
+
+@lru_cache(maxsize=1024)
+def _verify(
+    signed_message: str, key: str, attach_cose_key: bool
+) -> Tuple[bool, str, Address]:
+    """Decode and verify a hex-encoded COSESign1 message.
+
+    The result only depends on the (immutable) inputs, so it is cached to make verifying the same message
+    repeatedly cheap. It is returned as a tuple so cached results could not be modified by callers.
+    """
+    # Add back the "D2" header byte and decode
     decoded_message = CoseMessage.decode(bytes.fromhex("d2" + signed_message))
 
     # generate/extract the cose key
@@ -185,9 +208,6 @@ def verify(
 
     else:
         # i,e key is sent separately
-        assert isinstance(
-            key, str
-        ), "key must be a hex string if attach_cose_key is True"
         cose_key = CoseKey.decode(bytes.fromhex(key))
         verification_key = cose_key[OKPKpX]
 
@@ -225,8 +245,4 @@ def verify(
 
     verified = signature_verified & addresses_match
 
-    return {
-        "verified": verified,
-        "message": message,
-        "signing_address": signing_address,
-    }
+    return verified, message, signing_address
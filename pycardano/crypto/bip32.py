@@ -34,12 +34,23 @@ SUPPORTED_MNEMONIC_LANGS = {
 
 
 class BIP32ED25519PrivateKey:
-    def __init__(self, private_key: bytes, chain_code: bytes):
+    def __init__(
+        self,
+        private_key: bytes,
+        chain_code: bytes,
+        public_key: Optional[bytes] = None,
+    ):
         self.private_key = private_key
         self.left = self.private_key[:32]
         self.right = self.private_key[32:]
         self.chain_code = chain_code
-        self.public_key = bindings.crypto_scalarmult_ed25519_base_noclamp(self.left)
+        # The public key could be passed in when it is already known (e.g. stored alongside the private key)
+        # to skip the scalar multiplication.
+        self.public_key = (
+            public_key
+            if public_key is not None
+            else bindings.crypto_scalarmult_ed25519_base_noclamp(self.left)
+        )
 
     def sign(self, message: bytes) -> bytes:
         r = bindings.crypto_core_ed25519_scalar_reduce(
@@ -1,5 +1,6 @@
 """All type of hashes in Cardano ledger spec."""
 
+import hashlib
 from typing import Type, TypeVar, Union
 
 from pycardano.serialization import CBORSerializable, limit_primitive_type
@@ -40,6 +41,33 @@ VRF_KEY_HASH_SIZE = 32
 REWARD_ACCOUNT_HASH_SIZE = 29
 
 
+_BLAKE2B_TEMPLATES = {
+    size: hashlib.blake2b(digest_size=size)
+    for size in (VERIFICATION_KEY_HASH_SIZE, TRANSACTION_HASH_SIZE)
+}
+"""Pre-initialized blake2b hashers for the digest sizes used by the ledger (224 and 256 bits)."""
+
+
+def blake2b_hash(data: bytes, digest_size: int) -> bytes:
+    """Compute the raw blake2b digest of some data.
+
+    Not exposed to public by intention.
+
+    Args:
+        data (bytes): Data to hash.
+        digest_size (int): Size of the digest in bytes.
+
+    Returns:
+        bytes: The digest.
+    """
+    template = _BLAKE2B_TEMPLATES.get(digest_size)
+    if template is None:
+        return hashlib.blake2b(data, digest_size=digest_size).digest()
+    hasher = template.copy()
+    hasher.update(data)
+    return hasher.digest()
+
+
 T = TypeVar("T", bound="ConstrainedBytes")
 
 
@@ -55,6 +83,13 @@ class ConstrainedBytes(CBORSerializable):
     MAX_SIZE = 32
     MIN_SIZE = 0
 
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memodict={}):
+        # Instances are immutable, so they could be shared by copies.
+        return self
+
     def __init__(self, payload: bytes):
         assert self.MIN_SIZE <= len(payload) <= self.MAX_SIZE, (
             f"Invalid byte size: {len(payload)} for class {self.__class__}, "
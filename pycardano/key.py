@@ -4,16 +4,15 @@ from __future__ import annotations
 
 import json
 import os
-from typing import Optional, Type
+from functools import cached_property
+from typing import Optional, Tuple, Type
 
-from nacl.encoding import RawEncoder
-from nacl.hash import blake2b
+from nacl import bindings
 from nacl.public import PrivateKey
-from nacl.signing import SigningKey as NACLSigningKey
 
 from pycardano.crypto.bip32 import BIP32ED25519PrivateKey, HDWallet
 from pycardano.exception import InvalidKeyTypeException
-from pycardano.hash import VERIFICATION_KEY_HASH_SIZE, VerificationKeyHash
+from pycardano.hash import VERIFICATION_KEY_HASH_SIZE, VerificationKeyHash, blake2b_hash
 from pycardano.serialization import CBORSerializable, limit_primitive_type
 
 __all__ = [
@@ -156,14 +155,21 @@ class Key(CBORSerializable):
 
 
 class SigningKey(Key):
+    @cached_property
+    def _keypair(self) -> Tuple[bytes, bytes]:
+        """Ed25519 public key and libsodium secret key expanded from the seed.
+
+        Expanding the seed requires a scalar multiplication, so it is done once per key instead of on every call.
+        """
+        return bindings.crypto_sign_seed_keypair(self.payload)
+
     def sign(self, data: bytes) -> bytes:
-        signed_message = NACLSigningKey(self.payload).sign(data)
-        return signed_message.signature
+        signed_message = bindings.crypto_sign(data, self._keypair[1])
+        return signed_message[: bindings.crypto_sign_BYTES]
 
     def to_verification_key(self) -> VerificationKey:
-        verification_key = NACLSigningKey(self.payload).verify_key
         return VerificationKey(
-            bytes(verification_key),
+            self._keypair[0],
             self.key_type.replace("Signing", "Verification"),
             self.description.replace("Signing", "Verification"),
         )
@@ -182,7 +188,7 @@ class VerificationKey(Key):
             VerificationKeyHash: Hash output in bytes.
         """
         return VerificationKeyHash(
-            blake2b(self.payload, VERIFICATION_KEY_HASH_SIZE, encoder=RawEncoder)
+            blake2b_hash(self.payload, VERIFICATION_KEY_HASH_SIZE)
         )
 
     @classmethod
@@ -192,7 +198,9 @@ class VerificationKey(Key):
 
 class ExtendedSigningKey(Key):
     def sign(self, data: bytes) -> bytes:
-        private_key = BIP32ED25519PrivateKey(self.payload[:64], self.payload[96:])
+        private_key = BIP32ED25519PrivateKey(
+            self.payload[:64], self.payload[96:], public_key=self.payload[64:96]
+        )
         return private_key.sign(data)
 
     def to_verification_key(self) -> ExtendedVerificationKey:
@@ -4,11 +4,9 @@ from dataclasses import dataclass, field
 from typing import Any, ClassVar, List, Optional, Type, Union
 
 from cbor2 import CBORTag
-from nacl.encoding import RawEncoder
-from nacl.hash import blake2b
 
 from pycardano.exception import DeserializeException, InvalidArgumentException
-from pycardano.hash import AUXILIARY_DATA_HASH_SIZE, AuxiliaryDataHash
+from pycardano.hash import AUXILIARY_DATA_HASH_SIZE, AuxiliaryDataHash, blake2b_hash
 from pycardano.nativescript import NativeScript
 from pycardano.plutus import PlutusV1Script, PlutusV2Script, PlutusV3Script
 from pycardano.serialization import (
@@ -134,6 +132,4 @@ class AuxiliaryData(CBORSerializable):
         raise DeserializeException(f"Couldn't parse auxiliary data: {value}")
 
     def hash(self) -> AuxiliaryDataHash:
-        return AuxiliaryDataHash(
-            blake2b(self.to_cbor(), AUXILIARY_DATA_HASH_SIZE, encoder=RawEncoder)  # type: ignore
-        )
+        return AuxiliaryDataHash(blake2b_hash(self.to_cbor(), AUXILIARY_DATA_HASH_SIZE))
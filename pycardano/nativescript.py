@@ -5,11 +5,13 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import ClassVar, List, Type, Union, cast
 
-from nacl.encoding import RawEncoder
-from nacl.hash import blake2b
-
 from pycardano.exception import DeserializeException
-from pycardano.hash import SCRIPT_HASH_SIZE, ScriptHash, VerificationKeyHash
+from pycardano.hash import (
+    SCRIPT_HASH_SIZE,
+    ScriptHash,
+    VerificationKeyHash,
+    blake2b_hash,
+)
 from pycardano.serialization import (
     ArrayCBORSerializable,
     Primitive,
@@ -59,9 +61,7 @@ class NativeScript(ArrayCBORSerializable):
 
     def hash(self) -> ScriptHash:
         cbor_bytes = cast(bytes, self.to_cbor())
-        return ScriptHash(
-            blake2b(bytes(1) + cbor_bytes, SCRIPT_HASH_SIZE, encoder=RawEncoder)
-        )
+        return ScriptHash(blake2b_hash(bytes(1) + cbor_bytes, SCRIPT_HASH_SIZE))
 
     @classmethod
     def from_dict(
@@ -12,12 +12,16 @@ from typing import Any, List, Optional, Type, Union
 
 import cbor2
 from cbor2 import CBORTag
-from nacl.encoding import RawEncoder
-from nacl.hash import blake2b
 from typeguard import typechecked
 
 from pycardano.exception import DeserializeException, InvalidArgumentException
-from pycardano.hash import DATUM_HASH_SIZE, SCRIPT_HASH_SIZE, DatumHash, ScriptHash
+from pycardano.hash import (
+    DATUM_HASH_SIZE,
+    SCRIPT_HASH_SIZE,
+    DatumHash,
+    ScriptHash,
+    blake2b_hash,
+)
 from pycardano.nativescript import NativeScript
 from pycardano.serialization import (
     ArrayCBORSerializable,
@@ -930,10 +934,9 @@ Datum = Union[PlutusData, dict, int, bytes, IndefiniteList, RawCBOR, RawPlutusDa
 
 def datum_hash(datum: Datum) -> DatumHash:
     return DatumHash(
-        blake2b(
+        blake2b_hash(
             cbor2.dumps(datum, default=default_encoder),
             DATUM_HASH_SIZE,
-            encoder=RawEncoder,
         )
     )
 
@@ -1091,17 +1094,11 @@ def script_hash(script: ScriptType) -> ScriptHash:
     if isinstance(script, NativeScript):
         return script.hash()
     elif isinstance(script, PlutusV1Script) or type(script) is bytes:
-        return ScriptHash(
-            blake2b(bytes.fromhex("01") + script, SCRIPT_HASH_SIZE, encoder=RawEncoder)
-        )
+        return ScriptHash(blake2b_hash(bytes.fromhex("01") + script, SCRIPT_HASH_SIZE))
     elif isinstance(script, PlutusV2Script):
-        return ScriptHash(
-            blake2b(bytes.fromhex("02") + script, SCRIPT_HASH_SIZE, encoder=RawEncoder)
-        )
+        return ScriptHash(blake2b_hash(bytes.fromhex("02") + script, SCRIPT_HASH_SIZE))
     elif isinstance(script, PlutusV3Script):
-        return ScriptHash(
-            blake2b(bytes.fromhex("03") + script, SCRIPT_HASH_SIZE, encoder=RawEncoder)
-        )
+        return ScriptHash(blake2b_hash(bytes.fromhex("03") + script, SCRIPT_HASH_SIZE))
     else:
         raise TypeError(f"Unexpected script type: {type(script)}")
 
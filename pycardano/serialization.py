@@ -83,19 +83,21 @@ class RawCBOR:
     cbor: bytes
 
 
+# Runtime type checking tries the members of this union in order, so the types most commonly returned by
+# `to_primitive` and `to_shallow_primitive` are listed first to keep encoding fast.
 Primitive = Union[
+    list,
+    dict,
     bytes,
+    int,
     bytearray,
     str,
-    int,
     float,
     Decimal,
     bool,
     None,
     tuple,
-    list,
     IndefiniteList,
-    dict,
     defaultdict,
     OrderedDict,
     datetime,
@@ -187,7 +189,11 @@ def default_encoder(
     ), (
         f"Type of input value is not CBORSerializable, " f"got {type(value)} instead."
     )
-    if isinstance(value, (IndefiniteList, IndefiniteFrozenList)):
+    if isinstance(value, CBORSerializable):
+        # CBORSerializable is by far the most common type reaching this hook, so it is checked first
+        # to keep the per-value dispatch short when encoding large objects such as transaction bodies.
+        encoder.encode(value.to_validated_primitive())
+    elif isinstance(value, (IndefiniteList, IndefiniteFrozenList)):
         # Currently, cbor2 doesn't support indefinite list, therefore we need special
         # handling here to explicitly write header (b'\x9f'), each body item, and footer (b'\xff') to
         # the output bytestring.
@@ -211,7 +217,11 @@ def default_encoder(
     elif isinstance(value, frozendict):
         encoder.encode(dict(value))
     else:
-        encoder.encode(value.to_validated_primitive())
+        # Unsupported values must never be silently skipped, even when asserts are disabled,
+        # otherwise the enclosing array or map would be encoded with a missing item.
+        raise TypeError(
+            f"Type of input value is not CBORSerializable, got {type(value)} instead."
+        )
 
 
 @typechecked
@@ -2,15 +2,12 @@
 
 from __future__ import annotations
 
-from copy import deepcopy
 from dataclasses import dataclass, field
 from pprint import pformat
 from typing import Any, Callable, List, Optional, Type, Union
 
 import cbor2
 from cbor2 import CBORTag
-from nacl.encoding import RawEncoder
-from nacl.hash import blake2b
 
 from pycardano.address import Address
 from pycardano.certificate import Certificate
@@ -24,6 +21,7 @@ from pycardano.hash import (
     ScriptHash,
     TransactionId,
     VerificationKeyHash,
+    blake2b_hash,
 )
 from pycardano.metadata import AuxiliaryData
 from pycardano.nativescript import NativeScript
@@ -73,7 +71,7 @@ class TransactionInput(ArrayCBORSerializable):
     index: int
 
     def __hash__(self):
-        return hash(str(self.transaction_id) + str(self.index))
+        return hash((self.transaction_id, self.index))
 
 
 class AssetName(ConstrainedBytes):
@@ -100,9 +98,10 @@ class Asset(DictCBORSerializable):
         return self + other
 
     def __add__(self, other: Asset) -> Asset:
-        new_asset = deepcopy(self)
-        for n in other:
-            new_asset[n] = new_asset.get(n, 0) + other[n]
+        # Asset names and amounts are immutable, so a shallow copy is sufficient here.
+        new_asset = self.__class__(self.data)
+        for n, v in other.data.items():
+            new_asset.data[n] = new_asset.data.get(n, 0) + v
         return new_asset.normalize()
 
     def __iadd__(self, other: Asset) -> Asset:
@@ -111,9 +110,9 @@ class Asset(DictCBORSerializable):
         return self.normalize()
 
     def __sub__(self, other: Asset) -> Asset:
-        new_asset = deepcopy(self)
-        for n in other:
-            new_asset[n] = new_asset.get(n, 0) - other[n]
+        new_asset = self.__class__(self.data)
+        for n, v in other.data.items():
+            new_asset.data[n] = new_asset.data.get(n, 0) - v
         return new_asset.normalize()
 
     def __eq__(self, other):
@@ -128,8 +127,10 @@ class Asset(DictCBORSerializable):
             return True
 
     def __le__(self, other: Asset) -> bool:
-        for n in self:
-            if n not in other or self[n] > other[n]:
+        if len(self) > len(other) or not self.data.keys() <= other.data.keys():
+            return False
+        for n, v in self.data.items():
+            if v > other.data[n]:
                 return False
         return True
 
@@ -144,7 +145,7 @@ class Asset(DictCBORSerializable):
         return res
 
     def to_shallow_primitive(self) -> dict:
-        x = deepcopy(self).normalize()
+        x = self.__class__(self.data).normalize()
         return super(self.__class__, x).to_shallow_primitive()
 
 
@@ -165,10 +166,14 @@ class MultiAsset(DictCBORSerializable):
                 self.pop(k)
         return self
 
+    def _copy_assets(self) -> MultiAsset:
+        """Copy the MultiAsset and each of its Assets, without copying the immutable keys and amounts."""
+        return self.__class__({p: a.__class__(a.data) for p, a in self.data.items()})
+
     def __add__(self, other):
-        new_multi_asset = deepcopy(self)
-        for p in other:
-            new_multi_asset[p] = new_multi_asset.get(p, Asset()) + other[p]
+        new_multi_asset = self._copy_assets()
+        for p, a in other.data.items():
+            new_multi_asset.data[p] = new_multi_asset.data.get(p, Asset()) + a
         return new_multi_asset.normalize()
 
     def __iadd__(self, other):
@@ -177,9 +182,9 @@ class MultiAsset(DictCBORSerializable):
         return self.normalize()
 
     def __sub__(self, other: MultiAsset) -> MultiAsset:
-        new_multi_asset = deepcopy(self)
-        for p in other:
-            new_multi_asset[p] = new_multi_asset.get(p, Asset()) - other[p]
+        new_multi_asset = self._copy_assets()
+        for p, a in other.data.items():
+            new_multi_asset.data[p] = new_multi_asset.data.get(p, Asset()) - a
         return new_multi_asset.normalize()
 
     def __eq__(self, other):
@@ -194,8 +199,10 @@ class MultiAsset(DictCBORSerializable):
             return True
 
     def __le__(self, other: MultiAsset):
-        for p in self:
-            if p not in other or not self[p] <= other[p]:
+        if len(self) > len(other) or not self.data.keys() <= other.data.keys():
+            return False
+        for p, a in self.data.items():
+            if not a <= other.data[p]:
                 return False
         return True
 
@@ -251,7 +258,7 @@ class MultiAsset(DictCBORSerializable):
         return res
 
     def to_shallow_primitive(self) -> dict:
-        x = deepcopy(self).normalize()
+        x = self._copy_assets().normalize()
         return super(self.__class__, x).to_shallow_primitive()
 
 
@@ -269,7 +276,8 @@ class Value(ArrayCBORSerializable):
 
     def __add__(self, other: Union[Value, int]):
         if isinstance(other, int):
-            other = Value(other)
+            # Adding pure ADA leaves the multi-assets untouched, so skip building an empty Value to add.
+            return Value(self.coin + other, self.multi_asset._copy_assets().normalize())
         return Value(self.coin + other.coin, self.multi_asset + other.multi_asset)
 
     def __iadd__(self, other: Union[Value, int]):
@@ -280,7 +288,7 @@ class Value(ArrayCBORSerializable):
 
     def __sub__(self, other: Union[Value, int]) -> Value:
         if isinstance(other, int):
-            other = Value(other)
+            return Value(self.coin - other, self.multi_asset._copy_assets().normalize())
         return Value(self.coin - other.coin, self.multi_asset - other.multi_asset)
 
     def __eq__(self, other):
@@ -516,7 +524,7 @@ class UTxO(ArrayCBORSerializable):
         return pformat(vars(self))
 
     def __hash__(self):
-        return hash(blake2b(self.input.to_cbor() + self.output.to_cbor(), 32))
+        return hash(blake2b_hash(self.input.to_cbor() + self.output.to_cbor(), 32))
 
 
 class Withdrawals(DictCBORSerializable):
@@ -633,7 +641,7 @@ class TransactionBody(MapCBORSerializable):
             )
 
     def hash(self) -> bytes:
-        return blake2b(self.to_cbor(), TRANSACTION_HASH_SIZE, encoder=RawEncoder)  # type: ignore
+        return blake2b_hash(self.to_cbor(), TRANSACTION_HASH_SIZE)
 
     @property
     def id(self) -> TransactionId:
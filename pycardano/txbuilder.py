@@ -28,7 +28,13 @@ from pycardano.exception import (
     TransactionBuilderException,
     UTxOSelectionException,
 )
-from pycardano.hash import DatumHash, ScriptDataHash, ScriptHash, VerificationKeyHash
+from pycardano.hash import (
+    AuxiliaryDataHash,
+    DatumHash,
+    ScriptDataHash,
+    ScriptHash,
+    VerificationKeyHash,
+)
 from pycardano.key import ExtendedSigningKey, SigningKey, VerificationKey
 from pycardano.logging import log_state, logger
 from pycardano.metadata import AuxiliaryData
@@ -173,6 +179,8 @@ class TransactionBuilder:
 
     _should_estimate_execution_units: Optional[bool] = field(init=False, default=None)
 
+    _auxiliary_data_hash: Optional[AuxiliaryDataHash] = field(init=False, default=None)
+
     def add_input(self, utxo: UTxO) -> TransactionBuilder:
         """Add a specific UTxO to transaction's inputs.
 
@@ -971,9 +979,7 @@ class TransactionBuilder:
             fee=self.fee,
             ttl=self.ttl,
             mint=self.mint,
-            auxiliary_data_hash=(
-                self.auxiliary_data.hash() if self.auxiliary_data else None
-            ),
+            auxiliary_data_hash=self._build_auxiliary_data_hash(),
             script_data_hash=self.script_data_hash,
             required_signers=self.required_signers if self.required_signers else None,
             validity_start=self.validity_start,
@@ -992,6 +998,14 @@ class TransactionBuilder:
         )
         return tx_body
 
+    def _build_auxiliary_data_hash(self) -> Optional[AuxiliaryDataHash]:
+        if self._auxiliary_data_hash is not None:
+            # Precomputed for the duration of build()
+            return self._auxiliary_data_hash
+        if self.auxiliary_data:
+            return self.auxiliary_data.hash()
+        return None
+
     def _build_required_vkeys(self) -> Set[VerificationKeyHash]:
         vkey_hashes = self._input_vkey_hashes()
         vkey_hashes.update(self._required_signer_vkey_hashes())
@@ -1154,6 +1168,33 @@ class TransactionBuilder:
         Returns:
             TransactionBody: A transaction body.
         """
+        # Auxiliary data doesn't change while building, but the transaction body is rebuilt several times during
+        # fee estimation. Hash the auxiliary data once, instead of encoding it again for every estimation.
+        # The hash is always cleared afterwards, so a failed build doesn't leave a stale hash on the builder.
+        self._auxiliary_data_hash = (
+            self.auxiliary_data.hash() if self.auxiliary_data else None
+        )
+        try:
+            return self._build(
+                change_address,
+                merge_change,
+                collateral_change_address,
+                auto_validity_start_offset,
+                auto_ttl_offset,
+                auto_required_signers,
+            )
+        finally:
+            self._auxiliary_data_hash = None
+
+    def _build(
+        self,
+        change_address: Optional[Address],
+        merge_change: Optional[bool],
+        collateral_change_address: Optional[Address],
+        auto_validity_start_offset: Optional[int],
+        auto_ttl_offset: Optional[int],
+        auto_required_signers: Optional[bool],
+    ) -> TransactionBody:
         self._ensure_no_input_exclusion_conflict()
 
         # only automatically set the validity interval and required signers if scripts are involved
@@ -1552,6 +1593,9 @@ class TransactionBuilder:
 
         required_vkeys = self._build_required_vkeys()
 
+        # The body is final at this point, so its hash is computed once and shared by all signers.
+        tx_body_hash = tx_body.hash()
+
         for signing_key in set(signing_keys):
             vkey_hash = signing_key.to_verification_key().hash()
             if not force_skeys and vkey_hash not in required_vkeys:
@@ -1559,7 +1603,7 @@ class TransactionBuilder:
                     f"Verification key hash {vkey_hash} is not required for this tx."
                 )
                 continue
-            signature = signing_key.sign(tx_body.hash())
+            signature = signing_key.sign(tx_body_hash)
             witness_set.vkey_witnesses.append(
                 VerificationKeyWitness(signing_key.to_verification_key(), signature)
             )
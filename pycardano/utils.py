@@ -6,11 +6,14 @@ import math
 from typing import Dict, List, Optional, Union
 
 import cbor2
-from nacl.encoding import RawEncoder
-from nacl.hash import blake2b
 
 from pycardano.backend.base import ChainContext
-from pycardano.hash import SCRIPT_DATA_HASH_SIZE, SCRIPT_HASH_SIZE, ScriptDataHash
+from pycardano.hash import (
+    SCRIPT_DATA_HASH_SIZE,
+    SCRIPT_HASH_SIZE,
+    ScriptDataHash,
+    blake2b_hash,
+)
 from pycardano.plutus import COST_MODELS, CostModels, Datum, Redeemers
 from pycardano.serialization import default_encoder
 from pycardano.transaction import MultiAsset, TransactionOutput, Value
@@ -260,9 +263,8 @@ def script_data_hash(
     cost_models_bytes = cbor2.dumps(cost_models, default=default_encoder)
 
     return ScriptDataHash(
-        blake2b(
+        blake2b_hash(
             redeemer_bytes + datum_bytes + cost_models_bytes,
             SCRIPT_DATA_HASH_SIZE,
-            encoder=RawEncoder,
         )
     )
@@ -5,6 +5,9 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Any, List, Optional, Type, Union
 
+from nacl import bindings
+from nacl.exceptions import BadSignatureError
+
 from pycardano.key import ExtendedVerificationKey, VerificationKey
 from pycardano.nativescript import NativeScript
 from pycardano.plutus import (
@@ -35,6 +38,23 @@ class VerificationKeyWitness(ArrayCBORSerializable):
         if isinstance(self.vkey, ExtendedVerificationKey):
             self.vkey = self.vkey.to_non_extended()
 
+    def verify(self, message: bytes) -> bool:
+        """Check whether the signature of this witness is valid for a message, e.g. a transaction body hash.
+
+        Args:
+            message (bytes): The signed message.
+
+        Returns:
+            bool: True if the signature is valid, False otherwise.
+        """
+        if len(self.signature) != bindings.crypto_sign_BYTES:
+            return False
+        try:
+            bindings.crypto_sign_open(self.signature + message, self.vkey.payload)
+        except BadSignatureError:
+            return False
+        return True
+
     @classmethod
     @limit_primitive_type(list)
     def from_primitive(
@@ -88,3 +108,18 @@ class TransactionWitnessSet(MapCBORSerializable):
     plutus_v3_script: Optional[List[PlutusV3Script]] = field(
         default=None, metadata={"optional": True, "key": 7}
     )
+
+    def verify_vkey_witnesses(self, tx_body_hash: bytes) -> bool:
+        """Check that every verification key witness holds a valid signature of the transaction body.
+
+        Verification stops at the first invalid signature. Use :meth:`VerificationKeyWitness.verify` on individual
+        witnesses to find out which ones are invalid.
+
+        Args:
+            tx_body_hash (bytes): Hash of the transaction body, which should be computed once by the caller and
+                shared across all witnesses.
+
+        Returns:
+            bool: True if all signatures are valid (or there are no verification key witnesses), False otherwise.
+        """
+        return all(w.verify(tx_body_hash) for w in self.vkey_witnesses or [])
@@ -42,3 +42,10 @@ class AddressTest(TestCase):
 
         with self.assertRaises(DeserializeException):
             Address.from_primitive({})
+
+
+def test_decode_is_cached():
+    addr_str = "addr_test1vrm9x2zsux7va6w892g38tvchnzahvcd9tykqf3ygnmwtaqyfg52x"
+    addr = Address.decode(addr_str)
+    assert Address.decode(addr_str) is addr
+    assert addr == Address.from_primitive(addr_str)
@@ -208,3 +208,14 @@ def test_sign_and_verify_stake():
     assert verification["message"] == "Pycardano is cool."
     assert verification["signing_address"].payment_part == None
     assert verification["signing_address"].staking_part == STAKE_VK.hash()
+
+
+def test_verify_repeated_returns_fresh_result():
+    message = "Pycardano is cool."
+    signed_message = sign(message, signing_key=SK, network=Network.TESTNET)
+
+    first = verify(signed_message)
+    first["verified"] = False
+    second = verify(signed_message)
+    assert second["verified"]
+    assert second["message"] == message
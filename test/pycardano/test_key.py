@@ -1,6 +1,8 @@
 import pathlib
 import tempfile
 
+from nacl.signing import VerifyKey
+
 from pycardano.key import (
     ExtendedSigningKey,
     ExtendedVerificationKey,
@@ -106,6 +108,16 @@ def test_extended_payment_key_hash():
     )
 
 
+def test_payment_key_sign():
+    message = bytes.fromhex(
+        "1bf8beed1677524b44903f09a7bb596ffb9d48e368b19293ca834df19ddbb566"
+    )
+    signature = SK.sign(message)
+    assert len(signature) == 64
+    assert VerifyKey(VK.payload).verify(message, signature) == message
+    assert SK.to_verification_key().payload == VK.payload
+
+
 def test_extended_payment_key_sign():
     message = bytes.fromhex(
         "1bf8beed1677524b44903f09a7bb596ffb9d48e368b19293ca834df19ddbb566"
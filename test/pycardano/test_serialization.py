@@ -1,3 +1,5 @@
+import subprocess
+import sys
 from dataclasses import dataclass, field
 from test.pycardano.util import check_two_way_cbor
 from typing import Any, Dict, List, Optional, Set, Tuple, Union
@@ -15,6 +17,7 @@ from pycardano.serialization import (
     DictCBORSerializable,
     IndefiniteList,
     MapCBORSerializable,
+    default_encoder,
     limit_primitive_type,
 )
 
@@ -315,3 +318,24 @@ def test_deserialize_empty_value():
         transaction.transaction_body.outputs[0].amount.multi_asset
         == pycardano.MultiAsset()
     ), "Invalid deserialization of multi asset"
+
+
+def test_default_encoder_rejects_unsupported_type():
+    class Unsupported:
+        pass
+
+    with pytest.raises((AssertionError, TypeError)):
+        cbor2.dumps([Unsupported(), 1], default=default_encoder)
+
+    # Asserts are stripped with -O, the value must still not be silently dropped
+    code = (
+        "import cbor2\n"
+        "from pycardano.serialization import default_encoder\n"
+        "class Unsupported: pass\n"
+        "try:\n"
+        "    cbor2.dumps([Unsupported(), 1], default=default_encoder)\n"
+        "except TypeError:\n"
+        "    raise SystemExit(0)\n"
+        "raise SystemExit(1)\n"
+    )
+    assert subprocess.run([sys.executable, "-O", "-c", code]).returncode == 0
@@ -1,3 +1,4 @@
+import copy
 from dataclasses import dataclass
 from test.pycardano.util import check_two_way_cbor
 
@@ -231,6 +232,31 @@ def test_transaction():
     assert expected_tx_id == signed_tx.id
 
 
+def test_verify_vkey_witnesses():
+    tx_body = make_transaction_body()
+    tx_body_hash = tx_body.hash()
+    key_pairs = [PaymentKeyPair.generate() for _ in range(4)]
+    vk_witnesses = [
+        VerificationKeyWitness(p.verification_key, p.signing_key.sign(tx_body_hash))
+        for p in key_pairs
+    ]
+    witness_set = TransactionWitnessSet(vkey_witnesses=vk_witnesses)
+    assert all(w.verify(tx_body_hash) for w in vk_witnesses)
+    assert witness_set.verify_vkey_witnesses(tx_body_hash)
+    assert TransactionWitnessSet().verify_vkey_witnesses(tx_body_hash)
+
+    bad_witness = VerificationKeyWitness(
+        key_pairs[0].verification_key, key_pairs[1].signing_key.sign(tx_body_hash)
+    )
+    witness_set.vkey_witnesses.append(bad_witness)
+    assert not bad_witness.verify(tx_body_hash)
+    assert not bad_witness.verify(b"")
+    assert not witness_set.verify_vkey_witnesses(tx_body_hash)
+    assert not VerificationKeyWitness(
+        key_pairs[0].verification_key, b"too short"
+    ).verify(tx_body_hash)
+
+
 def test_multi_asset():
     serialized_value = [
         100,
@@ -320,6 +346,38 @@ def test_multi_asset_subtraction():
     )
 
 
+def test_deepcopy_multi_asset_shares_keys():
+    a = MultiAsset.from_primitive({b"1" * SCRIPT_HASH_SIZE: {b"Token1": 1}})
+    b = copy.deepcopy(a)
+    assert b == a
+    assert next(iter(b)) is next(iter(a))
+
+    b[ScriptHash(b"1" * SCRIPT_HASH_SIZE)][AssetName(b"Token1")] = 2
+    assert a[ScriptHash(b"1" * SCRIPT_HASH_SIZE)][AssetName(b"Token1")] == 1
+
+
+def test_multi_asset_arithmetic_does_not_share_assets():
+    a = MultiAsset.from_primitive(
+        {
+            b"1" * SCRIPT_HASH_SIZE: {b"Token1": 1, b"Token2": 2},
+            b"2" * SCRIPT_HASH_SIZE: {b"Token1": 1},
+        }
+    )
+    b = MultiAsset.from_primitive({b"1" * SCRIPT_HASH_SIZE: {b"Token1": 10}})
+
+    for result in (a + b, a - b):
+        for policy_id in result:
+            result[policy_id][AssetName(b"Token3")] = 100
+
+    assert a == MultiAsset.from_primitive(
+        {
+            b"1" * SCRIPT_HASH_SIZE: {b"Token1": 1, b"Token2": 2},
+            b"2" * SCRIPT_HASH_SIZE: {b"Token1": 1},
+        }
+    )
+    assert b == MultiAsset.from_primitive({b"1" * SCRIPT_HASH_SIZE: {b"Token1": 10}})
+
+
 def test_asset_comparison():
     a = Asset.from_primitive({b"Token1": 1, b"Token2": 2})
 
@@ -385,6 +443,22 @@ def test_multi_asset_comparison():
         a <= 1
 
 
+def test_value_arithmetic_with_int():
+    a = Value.from_primitive(
+        [1, {b"1" * SCRIPT_HASH_SIZE: {b"Token1": 1, b"Token2": 2}}]
+    )
+
+    b = a + 10
+    assert b == Value.from_primitive(
+        [11, {b"1" * SCRIPT_HASH_SIZE: {b"Token1": 1, b"Token2": 2}}]
+    )
+    assert b - 10 == a
+    assert b.multi_asset is not a.multi_asset
+
+    b.multi_asset[ScriptHash(b"1" * SCRIPT_HASH_SIZE)][AssetName(b"Token1")] = 100
+    assert a.multi_asset[ScriptHash(b"1" * SCRIPT_HASH_SIZE)][AssetName(b"Token1")] == 1
+
+
 def test_values():
     a = Value.from_primitive(
         [1, {b"1" * SCRIPT_HASH_SIZE: {b"Token1": 1, b"Token2": 2}}]
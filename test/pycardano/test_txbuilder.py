@@ -31,6 +31,7 @@ from pycardano.hash import (
     VerificationKeyHash,
 )
 from pycardano.key import VerificationKey
+from pycardano.metadata import AuxiliaryData, Metadata
 from pycardano.nativescript import (
     InvalidBefore,
     InvalidHereAfter,
@@ -2124,3 +2125,40 @@ def test_burning_all_assets_under_single_policy(chain_context):
         assert AssetName(b"AssetName2") not in multi_asset.get(policy_id_1, {})
         assert AssetName(b"AssetName3") not in multi_asset.get(policy_id_1, {})
         assert AssetName(b"AseetName4") not in multi_asset.get(policy_id_1, {})
+
+
+def test_build_hashes_auxiliary_data_once(chain_context):
+    sender = "addr_test1vrm9x2zsux7va6w892g38tvchnzahvcd9tykqf3ygnmwtaqyfg52x"
+    sender_address = Address.from_primitive(sender)
+
+    tx_builder = TransactionBuilder(chain_context)
+    tx_builder.add_input_address(sender).add_output(
+        TransactionOutput.from_primitive([sender, 500000])
+    )
+    tx_builder.auxiliary_data = AuxiliaryData(Metadata({1787: {"doc": "hash"}}))
+
+    with patch.object(
+        AuxiliaryData, "hash", autospec=True, side_effect=AuxiliaryData.hash
+    ) as mock_hash:
+        tx_body = tx_builder.build(change_address=sender_address)
+
+    assert mock_hash.call_count == 1
+    assert tx_body.auxiliary_data_hash == tx_builder.auxiliary_data.hash()
+
+
+def test_failed_build_does_not_keep_auxiliary_data_hash(chain_context):
+    sender = "addr_test1vrm9x2zsux7va6w892g38tvchnzahvcd9tykqf3ygnmwtaqyfg52x"
+    sender_address = Address.from_primitive(sender)
+
+    tx_builder = TransactionBuilder(chain_context)
+    tx_builder.add_input_address(sender).add_output(
+        TransactionOutput.from_primitive([sender, 500000000000])
+    )
+    tx_builder.auxiliary_data = AuxiliaryData(Metadata({1787: {"doc": "hash"}}))
+
+    with pytest.raises(UTxOSelectionException):
+        tx_builder.build(change_address=sender_address)
+
+    tx_builder.auxiliary_data = AuxiliaryData(Metadata({1787: {"doc": "other"}}))
+    tx_body = tx_builder._build_tx_body()
+    assert tx_body.auxiliary_data_hash == tx_builder.auxiliary_data.hash()